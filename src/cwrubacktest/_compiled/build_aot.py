@@ -0,0 +1,29 @@
+"""
+Ahead-of-time compilation of the backtest tick kernel.
+
+JIT warmup can dominate the runtime of short backtests, which makes
+rapid parameter iteration frustrating. Running this module compiles
+the kernel into a `cwrubt_kernels` extension module alongside this
+file via `numba.pycc`, which `backtest.py` imports in preference to
+JIT-compiling at first use:
+
+    python -m cwrubacktest._compiled.build_aot
+
+The build requires Numba and a working C compiler; the generated
+shared library is intentionally not committed.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from cwrubacktest.backtest.backtest import _rebalance_mask_py
+
+cc = CC('cwrubt_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export('rebalance_mask', 'b1[:](i8[:], i8[:], i8)')(_rebalance_mask_py)
+
+
+if __name__ == '__main__':
+    cc.compile()
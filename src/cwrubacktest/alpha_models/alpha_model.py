@@ -18,6 +18,10 @@ class AlphaModel():
 
     __metaclass__ = ABCMeta
 
+    # Empty slots so slotted subclasses are not silently given a
+    # per-instance __dict__ through this base class.
+    __slots__ = ()
+
     @abstractmethod
     def __call__(self, dt):
         raise NotImplementedError(
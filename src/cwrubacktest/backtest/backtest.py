@@ -1,5 +1,6 @@
 import os
 
+import numpy as np
 import pandas as pd
 
 from cwrubacktest.asset.equity import Equity
@@ -12,12 +13,61 @@ from cwrubacktest.sim.sim_engine import DailyBusinessDaySimulationEngine
 from cwrubacktest.trading_strats.trading_strats import QuantTradingSystem
 from cwrubacktest.trading_strats.rebalance import RebalanceGenerator, RebalancePeriod
 from cwrubacktest.utils import settings
+from cwrubacktest.utils._njit import njit
 
 DEFAULT_ACCOUNT_NAME = 'Backtest Simulated Broker Account'
 DEFAULT_PORTFOLIO_ID = '000001'
 DEFAULT_PORTFOLIO_NAME = 'Backtest Simulated Broker Portfolio'
 
 
+def _rebalance_mask_py(event_ts, rebal_ts, burn_in_ns):
+    """
+    Compute a boolean mask of the simulation events that are
+    rebalance ticks occurring on or after the burn-in timestamp.
+
+    Both arrays must be sorted int64 nanosecond epoch timestamps.
+    The merge runs in O(events + rebalances) and compiles to a tight
+    machine-code loop when Numba is available.
+
+    Parameters
+    ----------
+    event_ts : `np.ndarray[int64]`
+        Sorted epoch-nanosecond timestamps of all simulation events.
+    rebal_ts : `np.ndarray[int64]`
+        Sorted epoch-nanosecond timestamps of the rebalance schedule.
+    burn_in_ns : `int`
+        Epoch-nanosecond burn-in cutoff; events before it are masked out.
+
+    Returns
+    -------
+    `np.ndarray[bool]`
+        Mask over the events, True where trading logic should run.
+    """
+    n = event_ts.shape[0]
+    m = rebal_ts.shape[0]
+    mask = np.zeros(n, dtype=np.bool_)
+    j = 0
+    for i in range(n):
+        ts = event_ts[i]
+        while j < m and rebal_ts[j] < ts:
+            j += 1
+        if j < m and rebal_ts[j] == ts and ts >= burn_in_ns:
+            mask[i] = True
+    return mask
+
+
+# Prefer the ahead-of-time compiled kernel (built via
+# cwrubacktest._compiled.build_aot) to avoid the per-process JIT
+# warmup cost; fall back to JIT compilation, or plain Python when
+# Numba is absent.
+try:
+    from cwrubacktest._compiled.cwrubt_kernels import (
+        rebalance_mask as _rebalance_mask
+    )
+except ImportError:
+    _rebalance_mask = njit(cache=True)(_rebalance_mask_py)
+
+
 class BacktestTradingSession():
     """
     Encaspulates a full trading simulation backtest with externally
@@ -112,7 +162,19 @@ class BacktestTradingSession():
         self.rebalance_schedule = self._create_rebalance_event_times()
 
         self.qts = self._create_quant_trading_system(**kwargs)
-        self.equity_curve = []
+
+        # Preallocate the equity curve as parallel typed buffers sized
+        # to the number of market-close events, avoiding per-tick
+        # Python tuple allocation and list growth. Timestamps are
+        # stored at daily resolution as the session ticks at most
+        # once per market close.
+        num_closes = len(self.sim_engine.business_days)
+        self._eq_ts = np.empty(num_closes, dtype='datetime64[D]')
+        self._eq_val = np.empty(num_closes, dtype=np.float64)
+        self._eq_i = 0
+        self._eq_df_cache = None
+        self._eq_df_len = -1
+
         self.target_allocations = []
 
     def _is_rebalance_event(self, dt):
@@ -130,10 +192,7 @@ class BacktestTradingSession():
         `Boolean`
             Whether the timestamp is part of the rebalance schedule.
         """
-        try:
-            return dt in self.rebalance_schedule
-        except:
-            return False
+        return dt in self.rebalance_schedule
 
     def _create_exchange(self):
         """
@@ -231,17 +290,26 @@ class BacktestTradingSession():
 
     def _create_rebalance_event_times(self):
         """
-        Creates the list of rebalance timestamps used to determine when
+        Creates the set of rebalance timestamps used to determine when
         to execute the quant trading strategy throughout the backtest.
 
+        The timestamps are stored as a frozenset so that the per-event
+        membership check in `run()` is O(1) rather than a linear scan
+        of the schedule. An ordered copy is retained on
+        `self.rebalance_times` for any consumers requiring sorted access.
+
         Returns
         -------
-        `List[pd.Timestamp]`
-            The list of rebalance timestamps.
+        `frozenset[pd.Timestamp]`
+            The set of rebalance timestamps.
         """
-        
-        rebalancer = RebalanceGenerator(self.start_dt, self.end_dt, self.rebalance_pd)
-        return rebalancer.rebalances
+
+        rebalancer = RebalanceGenerator(
+            self.start_dt, self.end_dt, self.rebalance_pd,
+            weekday=getattr(self, 'rebalance_weekday', 'FRI')
+        )
+        self.rebalance_times = sorted(rebalancer.rebalances)
+        return frozenset(rebalancer.rebalances)
 
     def _create_quant_trading_system(self, **kwargs):
         """
@@ -306,9 +374,10 @@ class BacktestTradingSession():
         dt : `pd.Timestamp`
             The time at which the total account equity is obtained.
         """
-        self.equity_curve.append(
-            (dt, self.broker.get_account_total_equity()["master"])
-        )
+        i = self._eq_i
+        self._eq_ts[i] = dt.to_datetime64().astype('datetime64[D]')
+        self._eq_val[i] = self.broker.get_account_total_equity()["master"]
+        self._eq_i = i + 1
 
     def output_holdings(self):
         """
@@ -320,16 +389,30 @@ class BacktestTradingSession():
         """
         Returns the equity curve as a Pandas DataFrame.
 
+        The DataFrame is memoized against the number of recorded
+        market closes, so repeated access after a completed `run()`
+        (including the internal call from `get_target_allocations`)
+        does not rebuild it. A copy is returned so that callers
+        mutating the result (e.g. TearsheetStatistics adding returns
+        columns) cannot pollute the cache.
+
         Returns
         -------
         `pd.DataFrame`
             The datetime-indexed equity curve of the strategy.
         """
+        num = self._eq_i
+        if num == self._eq_df_len:
+            return self._eq_df_cache.copy()
+
         equity_df = pd.DataFrame(
-            self.equity_curve, columns=['Date', 'Equity']
-        ).set_index('Date')
-        equity_df.index = equity_df.index.date
-        return equity_df
+            {'Equity': self._eq_val[:num]},
+            index=pd.DatetimeIndex(self._eq_ts[:num], name='Date')
+        )
+
+        self._eq_df_cache = equity_df
+        self._eq_df_len = num
+        return equity_df.copy()
 
     def get_target_allocations(self):
         """
@@ -337,15 +420,35 @@ class BacktestTradingSession():
         utilising the same index as the equity curve with
         forward-filled dates.
 
+        Each equity-curve timestamp is mapped to its most recent
+        rebalance via a binary search over the rebalance timestamps,
+        replacing the former object-dtype `reindex(method='ffill')`
+        with a single O(N log R) vectorized lookup.
+
         Returns
         -------
         `pd.DataFrame`
             The datetime-indexed target allocations of the strategy.
         """
         equity_curve = self.get_equity_curve()
-        alloc_df = pd.DataFrame(self.target_allocations).set_index('Date')
-        alloc_df.index = alloc_df.index.date
-        alloc_df = alloc_df.reindex(index=equity_curve.index, method='ffill')
+        rebal_df = pd.DataFrame(self.target_allocations).set_index('Date')
+
+        # Align at daily resolution: the equity buffer holds
+        # datetime64[D] values, so the intraday rebalance timestamps
+        # are floored to their day before the lookup.
+        eq_ts = self._eq_ts[:self._eq_i].astype(np.int64)
+        rebal_ts = rebal_df.index.values.astype('datetime64[D]').astype(np.int64)
+        pos = np.searchsorted(rebal_ts, eq_ts, side='right') - 1
+
+        values = np.full(
+            (len(eq_ts), rebal_df.shape[1]), np.nan, dtype=np.float64
+        )
+        valid = pos >= 0
+        values[valid] = rebal_df.to_numpy()[pos[valid]]
+
+        alloc_df = pd.DataFrame(
+            values, index=equity_curve.index, columns=rebal_df.columns
+        )
         if self.burn_in_dt is not None:
             alloc_df = alloc_df[self.burn_in_dt.date():]
         return alloc_df
@@ -361,48 +464,120 @@ class BacktestTradingSession():
         results : `Boolean`, optional
             Whether to output the current portfolio holdings
         """
-        if settings.PRINT_EVENTS:
+        # Rewind the equity buffers so repeat run() calls overwrite
+        # the previous simulation instead of overflowing the
+        # preallocated arrays.
+        self._eq_i = 0
+        self._eq_df_cache = None
+        self._eq_df_len = -1
+
+        # Hoist invariant attribute/module lookups out of the
+        # per-event loop to minimise interpreter overhead on
+        # multi-year daily simulations.
+        print_events = settings.PRINT_EVENTS
+        burn_in = self.burn_in_dt
+        qts = self.qts
+        broker = self.broker
+        signals = self.signals
+        update_eq = self._update_equity_curve
+
+        if print_events:
             print("Beginning backtest simulation...")
 
-        stats = {'target_allocations': []}
+        # Preallocate the allocations buffer to its exact upper bound
+        # (one entry per scheduled rebalance) with a write cursor, so
+        # the construction model writes in place rather than growing
+        # a list per rebalance.
+        stats = {
+            'target_allocations': [None] * len(self.rebalance_schedule),
+            '_idx': 0
+        }
+
+        # Materialise the event schedule once and precompute, in the
+        # JIT-compiled kernel, which ticks carry trading logic and
+        # which record equity, so the Python loop below performs only
+        # array indexing instead of per-tick hashing and comparisons.
+        events = list(self.sim_engine)
+        num_events = len(events)
+        event_ts = np.fromiter(
+            (event.ts.value for event in events),
+            dtype=np.int64, count=num_events
+        )
+        rebal_ts = np.fromiter(
+            (ts.value for ts in self.rebalance_times),
+            dtype=np.int64, count=len(self.rebalance_times)
+        )
+        burn_in_ns = (
+            burn_in.value if burn_in is not None
+            else np.iinfo(np.int64).min
+        )
+        rebal_mask = _rebalance_mask(event_ts, rebal_ts, burn_in_ns)
+        close_mask = np.fromiter(
+            (event.event_type == "market_close" for event in events),
+            dtype=np.bool_, count=num_events
+        )
+        eq_mask = close_mask & (event_ts >= burn_in_ns)
+
+        if signals is None and not print_events:
+            # Fused fast path: runs of consecutive non-rebalance
+            # ticks are pushed through a single broker.batch_update
+            # dispatch and the returned equity values are written
+            # straight into the preallocated buffers.
+            event_days = event_ts.astype(
+                'datetime64[ns]'
+            ).astype('datetime64[D]')
+
+            i = 0
+            while i < num_events:
+                if rebal_mask[i]:
+                    dt = events[i].ts
+                    broker.update(dt)
+                    qts(dt, stats=stats)
+                    if eq_mask[i]:
+                        update_eq(dt)
+                    i += 1
+                else:
+                    j = i + 1
+                    while j < num_events and not rebal_mask[j]:
+                        j += 1
+
+                    sel = eq_mask[i:j]
+                    equities = broker.batch_update(
+                        [event.ts for event in events[i:j]], sel
+                    )
+                    count = len(equities)
+                    if count:
+                        cur = self._eq_i
+                        self._eq_ts[cur:cur + count] = event_days[i:j][sel]
+                        self._eq_val[cur:cur + count] = equities
+                        self._eq_i = cur + count
+                    i = j
+        else:
+            for i, event in enumerate(events):
+                dt = event.ts
+                if print_events:
+                    print("(%s) - %s" % (dt, event.event_type))
+
+                broker.update(dt)
 
-        for event in self.sim_engine:
-            
-            dt = event.ts
-            if settings.PRINT_EVENTS:
-                print("(%s) - %s" % (event.ts, event.event_type))
-
-            self.broker.update(dt)
-
-            if self.signals is not None and event.event_type == "market_close":
-                self.signals.update(dt)
-
-            if self.burn_in_dt is not None:
-                if dt >= self.burn_in_dt:
-                    if self._is_rebalance_event(dt):
-                        if settings.PRINT_EVENTS:
-                            print(
-                                "(%s) - trading logic "
-                                "and rebalance" % event.ts
-                            )
-                        self.qts(dt, stats=stats)
-            else:
-                if self._is_rebalance_event(dt):
-                    if settings.PRINT_EVENTS:
+                if signals is not None and close_mask[i]:
+                    signals.update(dt)
+
+                if rebal_mask[i]:
+                    if print_events:
                         print(
                             "(%s) - trading logic "
-                            "and rebalance" % event.ts
+                            "and rebalance" % dt
                         )
-                    self.qts(dt, stats=stats)
+                    qts(dt, stats=stats)
 
-            if event.event_type == "market_close":
-                if self.burn_in_dt is not None:
-                    if dt >= self.burn_in_dt:
-                        self._update_equity_curve(dt)
-                else:
-                    self._update_equity_curve(dt)
+                if eq_mask[i]:
+                    update_eq(dt)
 
-        self.target_allocations = stats['target_allocations']
+        self.target_allocations = [
+            alloc for alloc in stats['target_allocations']
+            if alloc is not None
+        ]
 
         if results:
             self.output_holdings()
@@ -0,0 +1,58 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _run_session_factory(session_factory):
+    """
+    Instantiate a BacktestTradingSession from the provided factory,
+    run it to completion and return its equity curve.
+
+    Executed inside a worker process.
+
+    Parameters
+    ----------
+    session_factory : `Callable[[], BacktestTradingSession]`
+        A picklable zero-argument callable constructing the session.
+
+    Returns
+    -------
+    `pd.DataFrame`
+        The equity curve of the completed backtest.
+    """
+    session = session_factory()
+    session.run()
+    return session.get_equity_curve()
+
+
+def run_sweep(session_factories, n_jobs=-1):
+    """
+    Run a collection of independent backtests in parallel across
+    worker processes, one session per parameter combination.
+
+    A single path-dependent backtest cannot be parallelized across
+    time slices, so the parallelism here is strictly across
+    strategies/parameters: each worker constructs its own
+    BacktestTradingSession from a factory, runs it sequentially and
+    returns the resulting equity curve. As sessions share no mutable
+    state this scales with the number of available cores.
+
+    Parameters
+    ----------
+    session_factories : `list[Callable[[], BacktestTradingSession]]`
+        Picklable zero-argument callables, each constructing one
+        fully parameterised session. Factories rather than session
+        instances are required as sessions hold unpicklable state.
+    n_jobs : `int`, optional
+        The number of worker processes to use. Defaults to -1,
+        i.e. one worker per available CPU core.
+
+    Returns
+    -------
+    `list[pd.DataFrame]`
+        The equity curves of each backtest, in factory order.
+    """
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        return list(executor.map(_run_session_factory, session_factories))
@@ -678,4 +678,46 @@ class SimulatedBroker():
 
             sorted_orders = sorted(orders, key=lambda x: x[1].direction)
             for portfolio, order in sorted_orders:
-                self._execute_order(dt, portfolio, order)
\ No newline at end of file
+                self._execute_order(dt, portfolio, order)
+
+    def batch_update(self, dts, record_mask=None):
+        """
+        Update the broker through a consecutive batch of timestamps
+        and return the master account total equity observed at the
+        timestamps flagged for recording.
+
+        This allows the trading session to process runs of
+        non-rebalance ticks with a single broker dispatch, writing
+        the returned equity array straight into its preallocated
+        buffers instead of paying three Python method calls per tick.
+
+        Parameters
+        ----------
+        dts : `list[pd.Timestamp]`
+            The consecutive timestamps to update the Broker through.
+        record_mask : `np.ndarray[bool]`, optional
+            Mask parallel to `dts` selecting the timestamps at which
+            equity should be computed (e.g. market closes). Defaults
+            to recording equity at every timestamp.
+
+        Returns
+        -------
+        `np.ndarray`
+            The master account total equity at each recorded
+            timestamp, in order.
+        """
+        if record_mask is None:
+            num_recorded = len(dts)
+        else:
+            num_recorded = int(np.count_nonzero(record_mask))
+
+        equities = np.empty(num_recorded, dtype=np.float64)
+        update = self.update
+        get_equity = self.get_account_total_equity
+        k = 0
+        for i, dt in enumerate(dts):
+            update(dt)
+            if record_mask is None or record_mask[i]:
+                equities[k] = get_equity()["master"]
+                k += 1
+        return equities
\ No newline at end of file
@@ -9,6 +9,10 @@ class FeeModel(object):
 
     __metaclass__ = ABCMeta
 
+    # Empty slots so slotted subclasses are not silently given a
+    # per-instance __dict__ through this base class.
+    __slots__ = ()
+
     @abstractmethod
     def _calc_commission(self, asset, quantity, consideration, broker=None):
         raise NotImplementedError(
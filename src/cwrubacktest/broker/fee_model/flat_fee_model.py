@@ -0,0 +1,114 @@
+import numpy as np
+
+from cwrubacktest.broker.fee_model.abs_fee_model import FeeModel
+
+
+class FlatFeeModel(FeeModel):
+    """
+    A FeeModel subclass that produces a flat per-share cost
+    for tax and commission.
+
+    Parameters
+    ----------
+    fee_per_share : `float`, optional
+        The flat commission applied per share traded.
+    tax_per_share : `float`, optional
+        The flat tax applied per share traded.
+    """
+
+    __slots__ = ('fee_per_share', 'tax_per_share', '_per_share_total')
+
+    def __init__(self, fee_per_share=0.0, tax_per_share=0.0):
+        super().__init__()
+        self.fee_per_share = fee_per_share
+        self.tax_per_share = tax_per_share
+        self._per_share_total = fee_per_share + tax_per_share
+
+    def _calc_commission(self, asset, quantity, consideration, broker=None):
+        """
+        Returns the flat per-share commission for the quantity traded.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol string.
+        quantity : `int`
+            The quantity of assets (needed for InteractiveBrokers
+            style calculations).
+        consideration : `float`
+            Price times quantity of the order.
+        broker : `Broker`, optional
+            An optional Broker reference.
+
+        Returns
+        -------
+        `float`
+            The flat per-share commission.
+        """
+        return abs(quantity) * self.fee_per_share
+
+    def _calc_tax(self, asset, quantity, consideration, broker=None):
+        """
+        Returns the flat per-share tax for the quantity traded.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol string.
+        quantity : `int`
+            The quantity of assets (needed for InteractiveBrokers
+            style calculations).
+        consideration : `float`
+            Price times quantity of the order.
+        broker : `Broker`, optional
+            An optional Broker reference.
+
+        Returns
+        -------
+        `float`
+            The flat per-share tax.
+        """
+        return abs(quantity) * self.tax_per_share
+
+    def calc_total_cost(self, asset, quantity, consideration, broker=None):
+        """
+        Calculate the total of any commission and/or tax
+        for the trade of size 'consideration'.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol string.
+        quantity : `int`
+            The quantity of assets (needed for InteractiveBrokers
+            style calculations).
+        consideration : `float`
+            Price times quantity of the order.
+        broker : `Broker`, optional
+            An optional Broker reference.
+
+        Returns
+        -------
+        `float`
+            The total commission and tax.
+        """
+        return abs(quantity) * self._per_share_total
+
+    def calc_total_cost_batch(self, quantities):
+        """
+        Calculate the total commission and tax for a batch of order
+        quantities in a single vectorized operation, avoiding
+        per-order Python method dispatch when pricing an entire
+        rebalance at once.
+
+        Parameters
+        ----------
+        quantities : `np.ndarray`
+            The order quantities to price.
+
+        Returns
+        -------
+        `np.ndarray`
+            The total commission and tax per order.
+        """
+        return np.abs(quantities) * self._per_share_total
@@ -76,6 +76,4 @@ class ZeroFeeModel(FeeModel):
         `float`
             The zero-cost total commission and tax.
         """
-        commission = self._calc_commission(asset, quantity, consideration, broker)
-        tax = self._calc_tax(asset, quantity, consideration, broker)
-        return commission + tax
\ No newline at end of file
+        return 0.0
\ No newline at end of file
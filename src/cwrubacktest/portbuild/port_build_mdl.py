@@ -285,7 +285,14 @@ class PortfolioConstructionModel():
         if stats is not None:
             alloc_dict = {'Date': dt}
             alloc_dict.update(full_weights)
-            stats['target_allocations'].append(alloc_dict)
+            # Write into the preallocated buffer when the caller
+            # provides a cursor, otherwise append for plain lists.
+            idx = stats.get('_idx')
+            if idx is None:
+                stats['target_allocations'].append(alloc_dict)
+            else:
+                stats['target_allocations'][idx] = alloc_dict
+                stats['_idx'] = idx + 1
 
         # Calculate target portfolio in notional
         target_portfolio = self._generate_target_portfolio(dt, full_weights)
@@ -9,6 +9,16 @@ class RebalancePeriod(Enum):
     MONTHLY = 3
     NEVER = 4
 
+
+# Pandas frequency string per periodic rebalance type; '{wd}' is
+# substituted with the configured weekday. NEVER is handled as an
+# explicit fast path in `_generate_rebalances`.
+_FREQ = {
+    RebalancePeriod.DAILY: 'B',
+    RebalancePeriod.WEEKLY: 'W-{wd}',
+    RebalancePeriod.MONTHLY: 'BME'
+}
+
 class RebalanceGenerator():
     """
     Generates a list of rebalance timestamps for pre- or post-market,
@@ -27,6 +37,9 @@ class RebalanceGenerator():
         Whether to carry out the rebalance at market open/close on
         the final day of the month. Defaults to False, i.e at
         market close.
+    weekday : `str`, optional
+        The three-letter weekday string (e.g. 'WED') used for
+        weekly rebalances. Defaults to 'FRI'.
     """
 
     def __init__(
@@ -34,11 +47,13 @@ class RebalanceGenerator():
         start_dt,
         end_dt,
         rebal_pd: RebalancePeriod,
-        pre_market=False
+        pre_market=False,
+        weekday='FRI'
     ):
         self.start_dt = start_dt
         self.end_dt = end_dt
         self.rebal_pd = rebal_pd
+        self.weekday = weekday
         self.market_time = self._set_market_time(pre_market)
         self.rebalances = self._generate_rebalances()
 
@@ -74,61 +89,36 @@ class RebalanceGenerator():
         Utilise the Pandas date_range method to create the appropriate
         list of rebalance timestamps.
 
+        The market time is applied as a single vectorized Timedelta
+        addition on the DatetimeIndex rather than constructing each
+        tz-aware Timestamp from a formatted string. The frequency for
+        each periodic rebalance type is resolved through the
+        module-level `_FREQ` dispatch table so all periodic arms
+        funnel through a single date_range construction.
+
         Returns
         -------
         `List[pd.Timestamp]`
             The list of rebalance timestamps.
         """
-
-        match self.rebal_pd:
-            case RebalancePeriod.DAILY:
-                rebalance_dates = pd.bdate_range(
-                    start=self.start_dt, end=self.end_dt,
-                )
-
-                rebalance_times = [
-                    pd.Timestamp(
-                        "%s %s" % (date, self.market_time), tz=pytz.utc
-                    )
-                    for date in rebalance_dates
-                ]
-
-                return rebalance_times
-
-            case RebalancePeriod.WEEKLY:
-                rebalance_dates = pd.date_range(
-                    start=self.start_dt,
-                    end=self.end_dt,
-                    freq='W-%s' % self.weekday
-                )
-
-                rebalance_times = [
-                    pd.Timestamp(
-                        "%s %s" % (date, self.pre_market_time), tz=pytz.utc
-                    )
-                    for date in rebalance_dates
-                ]
-
-                return rebalance_times
-
-            case RebalancePeriod.MONTHLY:
-                rebalance_dates = pd.date_range(
-                    start=self.start_dt,
-                    end=self.end_dt,
-                    freq='BME'
-                )
-
-                rebalance_times = [
-                    pd.Timestamp(
-                        "%s %s" % (date, self.market_time), tz=pytz.utc
-                    )
-                    for date in rebalance_dates
-                ]
-                return rebalance_times
-            
-            case RebalancePeriod.NEVER:
-                if not self._is_business_day():
-                    rebalance_date = self.start_dt + BusinessDay()
-                else:
-                    rebalance_date = self.start_dt
-                return [rebalance_date]
\ No newline at end of file
+        if self.rebal_pd == RebalancePeriod.NEVER:
+            if not self._is_business_day():
+                rebalance_date = self.start_dt + BusinessDay()
+            else:
+                rebalance_date = self.start_dt
+            return [rebalance_date]
+
+        rebalance_dates = pd.date_range(
+            start=self.start_dt,
+            end=self.end_dt,
+            freq=_FREQ[self.rebal_pd].format(wd=self.weekday)
+        )
+
+        rebalance_times = rebalance_dates.normalize() + pd.Timedelta(
+            self.market_time
+        )
+        if rebalance_times.tz is None:
+            rebalance_times = rebalance_times.tz_localize(pytz.utc)
+        else:
+            rebalance_times = rebalance_times.tz_convert(pytz.utc)
+        return rebalance_times.tolist()
\ No newline at end of file
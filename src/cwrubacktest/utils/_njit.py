@@ -0,0 +1,24 @@
+"""
+Optional Numba shim.
+
+Numba is not a hard dependency of cwrubacktest. Modules wishing to
+JIT-compile numerical kernels should import `njit` from here rather
+than from `numba` directly. When Numba is installed the real
+decorator is re-exported; otherwise a no-op stand-in is provided so
+the decorated functions simply run as pure Python/NumPy.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """
+        No-op replacement for `numba.njit` supporting both the bare
+        `@njit` and parameterised `@njit(...)` decoration forms.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator